@@ -1,12 +1,12 @@
 import json
-import random
+
+import numpy as np
 
 
 def generate_random_points(num_points, x, y):
-    points = []
-    for point in range(num_points):
-        points.append((random.randint(0, x), random.randint(0, y)))
-    return points
+    rng = np.random.default_rng()
+    points = rng.integers(low=0, high=(x + 1, y + 1), size=(num_points, 2))
+    return points.tolist()
 
 def main():
     num_points = 45
@@ -1,5 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
 class DelaunayTriangulation:
     points = [(2,4),(5.3,4.5),(18,29),(12.5,23.7)]
@@ -7,15 +8,25 @@ class DelaunayTriangulation:
         self._points = self.points
 
         self.triangles = []
+        self.centres = {}
 
     def triangulate(self):
+        self.centres.clear()
         self.points = np.array(self._points)
-        abscisses = self.points[:, 0]
-        ordonnees = self.points[:, 1]
-        colone=abscisses**2+ordonnees**2
-        colone_1=np.ones(len(self.points))
-        matrice=np.column_stack((abscisses,ordonnees,colone,colone_1))
-        determinant=np.linalg.det(matrice)
+        (x1, y1), (x2, y2), (x3, y3), (x4, y4) = self._points
+        # Determinant du test "dans le cercle" : le 4x4 se ramene a un 3x3
+        # en retranchant le quatrieme point aux trois autres.
+        ax, ay = x1 - x4, y1 - y4
+        bx, by = x2 - x4, y2 - y4
+        cx, cy = x3 - x4, y3 - y4
+        a2 = ax * ax + ay * ay
+        b2 = bx * bx + by * by
+        c2 = cx * cx + cy * cy
+        determinant = (
+            ax * (by * c2 - b2 * cy)
+            - ay * (bx * c2 - b2 * cx)
+            + a2 * (bx * cy - by * cx)
+        )
         if determinant>0:
             self.triangles.append((0, 1, 3))
             self.triangles.append([1, 2, 3])
@@ -25,37 +36,52 @@ class DelaunayTriangulation:
 
 
     def calculer_centre(self,indice_triangle):
+        if indice_triangle in self.centres:
+            return self.centres[indice_triangle]
         triangle = self.triangles[indice_triangle]
         x1, y1 = self.points[triangle[0]]
         x2, y2 = self.points[triangle[1]]
         x3, y3 = self.points[triangle[2]]
-        A = np.array([[x1, y1, 1], [x2, y2, 1], [x3, y3, 1]])
-        B = np.array([[-(x1**2 + y1**2)], [-(x2**2 + y2**2)], [-(x3**2 + y3**2)]])
-        C = np.linalg.solve(A, B)
-        Ox = -C[0][0] / 2
-        Oy = -C[1][0]  / 2
+        # Formule fermee du centre du cercle circonscrit
+        ax, ay = x1 - x3, y1 - y3
+        bx, by = x2 - x3, y2 - y3
+        a2 = ax * (x1 + x3) + ay * (y1 + y3)
+        b2 = bx * (x2 + x3) + by * (y2 + y3)
+        D = 2 * (ax * by - bx * ay)
+        Ox = (a2 * by - b2 * ay) / D
+        Oy = (b2 * ax - a2 * bx) / D
+        self.centres[indice_triangle] = (Ox, Oy)
         return (Ox, Oy)
 
-    def afficher_voronoi(self):
+    def afficher_voronoi(self, ax=None):
+        # Sans ax : fenetre pyplot bloquante. Avec ax : dessin seul, sans
+        # plt.show(), pour les traitements par lot (backend Agg + savefig).
+        afficher = ax is None
+        if ax is None:
+            ax = plt.gca()
         centre1=self.calculer_centre(0)
         centre2=self.calculer_centre(1)
-        plt.scatter(self.points[:, 0], self.points[:, 1], c='g')
-        plt.scatter(centre1[0], centre1[1], c='r')
-        plt.scatter(centre2[0], centre2[1], c='r')
-        plt.plot([centre1[0], centre2[0]], [centre1[1], centre2[1]], 'r-')
-        self.tracer_rayon(centre1, 0, 1)
-        self.tracer_rayon(centre2, 1, 2)
-        self.tracer_rayon(centre2, 2, 3)
-        self.tracer_rayon(centre1, 3, 0)
-        plt.title('Diagramme de Voronoi')
-        plt.xlabel('X-axis')    
-        plt.ylabel('Y-axis')
-        plt.grid()
-        plt.xlim(-5, 25)
-        plt.ylim(-5, 35)
-        plt.show()
+        ax.scatter(self.points[:, 0], self.points[:, 1], c='g')
+        ax.scatter(centre1[0], centre1[1], c='r')
+        ax.scatter(centre2[0], centre2[1], c='r')
+        ax.plot([centre1[0], centre2[0]], [centre1[1], centre2[1]], 'r-')
+        self.tracer_rayon(centre1, 0, 1, ax)
+        self.tracer_rayon(centre2, 1, 2, ax)
+        self.tracer_rayon(centre2, 2, 3, ax)
+        self.tracer_rayon(centre1, 3, 0, ax)
+        ax.set_title('Diagramme de Voronoi')
+        ax.set_xlabel('X-axis')
+        ax.set_ylabel('Y-axis')
+        ax.grid()
+        ax.set_xlim(-5, 25)
+        ax.set_ylim(-5, 35)
+        if afficher:
+            plt.show()
+        return ax.figure
 
-    def tracer_rayon(self, centre, indice_A, indice_B) :
+    def tracer_rayon(self, centre, indice_A, indice_B, ax=None) :
+        if ax is None:
+            ax = plt.gca()
         point_A = self.points[indice_A]
         point_B = self.points[indice_B]
         dx = point_B[0] - point_A[0]
@@ -64,7 +90,7 @@ class DelaunayTriangulation:
         vecteur_y = -dx
         Valeur_fin_x = centre[0] + 100 * vecteur_x
         Valeur_fin_y = centre[1] + 100 * vecteur_y
-        plt.plot([centre[0], Valeur_fin_x], [centre[1], Valeur_fin_y], 'r--')
+        ax.plot([centre[0], Valeur_fin_x], [centre[1], Valeur_fin_y], 'r--')
 
 
 
@@ -72,17 +98,22 @@ class DelaunayTriangulation:
 
 
         
-    def afficher_triangle_delaunay(self):
-        for triangle in self.triangles:
-            x = [self.points[triangle[0]][0], self.points[triangle[1]][0], self.points[triangle[2]][0], self.points[triangle[0]][0]]
-            y = [self.points[triangle[0]][1], self.points[triangle[1]][1], self.points[triangle[2]][1], self.points[triangle[0]][1]]
-            plt.plot(x, y, 'b-')
-        plt.scatter(self.points[:, 0], self.points[:, 1], c='r')
-        plt.title('Delaunay Triangulation')
-        plt.xlabel('X-axis')
-        plt.ylabel('Y-axis')
-        plt.grid()
-        plt.show()
+    def afficher_triangle_delaunay(self, ax=None):
+        afficher = ax is None
+        if ax is None:
+            ax = plt.gca()
+        # Un seul LineCollection pour tous les triangles (contour ferme a,b,c,a)
+        triangles = np.array(self.triangles)
+        contours = self.points[triangles[:, [0, 1, 2, 0]]]
+        ax.add_collection(LineCollection(contours, colors='b'))
+        ax.scatter(self.points[:, 0], self.points[:, 1], c='r')
+        ax.set_title('Delaunay Triangulation')
+        ax.set_xlabel('X-axis')
+        ax.set_ylabel('Y-axis')
+        ax.grid()
+        if afficher:
+            plt.show()
+        return ax.figure
         
 
 
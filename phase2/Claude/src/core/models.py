@@ -5,12 +5,15 @@ Using dataclasses for clean, typed, value-object semantics.
 """
 from __future__ import annotations
 
+import math
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import cached_property
+from typing import Callable, Hashable, List, Optional, Tuple
 import numpy as np
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Point:
     """A 2-D point with floating-point coordinates."""
 
@@ -18,7 +21,7 @@ class Point:
     y: float
 
     def __post_init__(self) -> None:
-        if not (np.isfinite(self.x) and np.isfinite(self.y)):
+        if not (math.isfinite(self.x) and math.isfinite(self.y)):
             raise ValueError(f"Point coordinates must be finite numbers, got ({self.x}, {self.y})")
 
     def to_array(self) -> np.ndarray:
@@ -28,7 +31,26 @@ class Point:
         return f"Point({self.x}, {self.y})"
 
 
-@dataclass(frozen=True)
+def points_to_array(points: List[Point]) -> np.ndarray:
+    """Return the coordinates of *points* as a contiguous (N, 2) float64 array."""
+    return np.fromiter(
+        (c for p in points for c in (p.x, p.y)), dtype=np.float64, count=2 * len(points)
+    ).reshape(-1, 2)
+
+
+def points_from_array(coords: np.ndarray) -> List[Point]:
+    """Return one Point per row of an (N, 2) coordinate array."""
+    return [Point(x, y) for x, y in coords.tolist()]
+
+
+def validate_points_array(coords: np.ndarray) -> None:
+    """Raise ValueError unless every coordinate in *coords* is a finite number."""
+    if not np.isfinite(coords).all():
+        bad = int(np.count_nonzero(~np.isfinite(coords).all(axis=-1)))
+        raise ValueError(f"Point coordinates must be finite numbers, got {bad} non-finite point(s)")
+
+
+@dataclass(frozen=True, slots=True)
 class BoundingBox:
     """Axis-aligned bounding box used for clipping infinite Voronoi ridges."""
 
@@ -36,6 +58,13 @@ class BoundingBox:
     y_min: float
     x_max: float
     y_max: float
+    # Derived once at construction; read on every coordinate mapping
+    width: float = field(init=False, repr=False, compare=False)
+    height: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "width", self.x_max - self.x_min)
+        object.__setattr__(self, "height", self.y_max - self.y_min)
 
     @classmethod
     def from_points(cls, points: List[Point], margin: float = 1.0) -> "BoundingBox":
@@ -49,13 +78,24 @@ class BoundingBox:
             y_max=max(ys) + margin,
         )
 
-    @property
-    def width(self) -> float:
-        return self.x_max - self.x_min
+    @classmethod
+    def from_array(cls, coords: np.ndarray, margin: float = 1.0) -> "BoundingBox":
+        """Build a bounding box around an (N, 2) coordinate array, with extra margin."""
+        x_min, y_min = coords.min(axis=0)
+        x_max, y_max = coords.max(axis=0)
+        return cls(
+            x_min=float(x_min) - margin,
+            y_min=float(y_min) - margin,
+            x_max=float(x_max) + margin,
+            y_max=float(y_max) + margin,
+        )
+
 
-    @property
-    def height(self) -> float:
-        return self.y_max - self.y_min
+# (ridge endpoints (2M, 2), sites (S, 2)) in pixel space
+PixelCoords = Tuple[np.ndarray, np.ndarray]
+
+# Viewports whose pixel arrays are kept per diagram (least recently used dropped)
+PIXEL_CACHE_SIZE: int = 4
 
 
 @dataclass
@@ -67,14 +107,49 @@ class VoronoiDiagram:
     ----------
     sites : original input points (generators)
     vertices : Voronoi vertex coordinates
-    ridge_vertices : pairs of vertex indices forming each ridge
+    ridge_vertices : (R, 2) integer array of vertex indices forming each ridge
                      (-1 means the ridge extends to infinity)
-    ridge_points : pairs of site indices on each side of a ridge
+    ridge_points : (R, 2) integer array of site indices on each side of a ridge
     bounding_box : the clipping region used for rendering
+    sites_xy : (S, 2) float array of the site coordinates, row i being
+               sites[i]; built from *sites* when not supplied
+
+    Pixel coordinates derived for the few most recent viewports are memoised
+    on the diagram (see ``pixel_coords``) so redraws and exports reuse them.
     """
 
     sites: List[Point]
     vertices: np.ndarray                   # shape (V, 2)
-    ridge_vertices: List[List[int]]        # list of [i, j] pairs
-    ridge_points: List[List[int]]          # list of [p, q] pairs
+    ridge_vertices: np.ndarray             # shape (R, 2), [i, j] per ridge
+    ridge_points: np.ndarray               # shape (R, 2), [p, q] per ridge
     bounding_box: BoundingBox
+    sites_xy: Optional[np.ndarray] = field(default=None, repr=False)  # shape (S, 2)
+    _pixel_cache: "OrderedDict[Hashable, PixelCoords]" = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.sites_xy is None:
+            self.sites_xy = points_to_array(self.sites)
+
+    @cached_property
+    def sites_center(self) -> np.ndarray:
+        """Mean of the site coordinates, used to orient infinite ridges outward."""
+        return self.sites_xy.mean(axis=0)
+
+    def pixel_coords(self, key: Hashable, build: Callable[[], PixelCoords]) -> PixelCoords:
+        """
+        Return the (ridge endpoints, sites) pixel arrays cached under *key*.
+
+        *key* must identify every viewport parameter the transform depends on;
+        *build* is only called when the key is not among the PIXEL_CACHE_SIZE
+        most recently used ones.
+        """
+        coords = self._pixel_cache.get(key)
+        if coords is not None:
+            self._pixel_cache.move_to_end(key)
+            return coords
+        coords = self._pixel_cache[key] = build()
+        if len(self._pixel_cache) > PIXEL_CACHE_SIZE:
+            self._pixel_cache.popitem(last=False)
+        return coords
@@ -0,0 +1,64 @@
+"""
+ridges.py — Turns Voronoi ridges into drawable world-space segments.
+
+Pure geometry on the domain model, shared by every exporter and the canvas
+renderer so that infinite-ridge handling lives in one place (DRY). Infinite
+ridges are projected outward from their finite vertex far enough to leave
+the bounding box.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from src.core.models import VoronoiDiagram
+
+
+def compute_ridge_segments(diagram: VoronoiDiagram) -> np.ndarray:
+    """
+    Return the world-coordinate endpoints of every drawable ridge.
+
+    The result is an (M, 2, 2) array in ridge order.  For infinite ridges
+    (one index == -1) the far endpoint is found by projecting outward from
+    the finite vertex along the perpendicular bisector of the two
+    generating sites.  Ridges with both endpoints at infinity, or whose
+    sites coincide, are left out.
+    """
+    bb = diagram.bounding_box
+    vertices = diagram.vertices
+    ridge_vertices = diagram.ridge_vertices
+    ridge_points = diagram.ridge_points
+
+    segments = np.empty((len(ridge_vertices), 2, 2), dtype=np.float64)
+    drawable = (ridge_vertices >= 0).all(axis=1)
+
+    # Finite ridges
+    segments[drawable] = vertices[ridge_vertices[drawable]]
+
+    # Infinite ridges — project from the finite vertex along the bisector
+    infinite = np.flatnonzero(~drawable)
+    finite_idx = ridge_vertices[infinite].max(axis=1)
+
+    sites = diagram.sites_xy
+    p = sites[ridge_points[infinite, 0]]
+    q = sites[ridge_points[infinite, 1]]
+    midpoint = (p + q) / 2.0
+    direction = np.column_stack((-(q[:, 1] - p[:, 1]), q[:, 0] - p[:, 0]))
+
+    # Ensure each direction points away from the interior of the diagram
+    center = diagram.sites_center
+    inward = np.einsum("ij,ij->i", midpoint - center, direction) < 0
+    direction = np.where(inward[:, None], -direction, direction)
+
+    # Skip ridges with both endpoints at infinity or a degenerate direction
+    norm = np.linalg.norm(direction, axis=1)
+    keep = (finite_idx >= 0) & (norm != 0)
+    infinite, finite_idx = infinite[keep], finite_idx[keep]
+    direction, norm = direction[keep], norm[keep]
+
+    far_length = max(bb.width, bb.height) * 2
+    finite_vertex = vertices[finite_idx]
+    segments[infinite, 0] = finite_vertex
+    segments[infinite, 1] = finite_vertex + (direction / norm[:, None]) * far_length
+    drawable[infinite] = True
+
+    return segments[drawable]
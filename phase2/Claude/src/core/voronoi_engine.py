@@ -11,12 +11,22 @@ Why SciPy / Fortune?
 """
 from __future__ import annotations
 
-from typing import List
+import hashlib
+from collections import OrderedDict
+from itertools import chain
+from typing import List, Optional
 
 import numpy as np
 from scipy.spatial import Voronoi  # type: ignore
 
-from src.core.models import BoundingBox, Point, VoronoiDiagram
+from src.core.models import (
+    BoundingBox,
+    Point,
+    VoronoiDiagram,
+    points_from_array,
+    points_to_array,
+    validate_points_array,
+)
 
 # Minimum number of distinct points required by Voronoi triangulation
 MIN_POINTS_REQUIRED: int = 3
@@ -24,6 +34,9 @@ MIN_POINTS_REQUIRED: int = 3
 # Default margin added around the bounding box for infinite ridge clipping
 DEFAULT_BOUNDING_MARGIN: float = 2.0
 
+# Number of recently computed diagrams kept for reuse
+DIAGRAM_CACHE_SIZE: int = 8
+
 
 class InsufficientPointsError(ValueError):
     """Raised when fewer than MIN_POINTS_REQUIRED distinct points are provided."""
@@ -31,14 +44,22 @@ class InsufficientPointsError(ValueError):
 
 class VoronoiEngine:
     """
-    Computes a Voronoi diagram from a list of Point objects.
+    Computes a Voronoi diagram from a list of Point objects or an (N, 2)
+    coordinate array.
 
     Responsibilities (SRP):
       - Validate input
       - Delegate computation to SciPy
       - Convert SciPy output → VoronoiDiagram domain object
+
+    The most recent diagrams are kept in a small LRU cache keyed by a digest
+    of the input coordinates, so recomputing a recent point set skips Qhull
+    entirely.
     """
 
+    def __init__(self) -> None:
+        self._cache: "OrderedDict[bytes, VoronoiDiagram]" = OrderedDict()
+
     def compute(self, points: List[Point]) -> VoronoiDiagram:
         """
         Compute and return the Voronoi diagram for *points*.
@@ -54,43 +75,114 @@ class VoronoiEngine:
         Raises
         ------
         InsufficientPointsError : if fewer than 3 distinct points are supplied
+        ValueError              : if any coordinate is not a finite number
         """
-        self._validate(points)
+        # points_to_array already returns a fresh array, so no defensive copy
+        return self._compute(points_to_array(points), sites=points)
 
-        coords: np.ndarray = np.array([[p.x, p.y] for p in points])
-        voronoi = Voronoi(coords)
+    def compute_array(
+        self, coords: np.ndarray, sites: Optional[List[Point]] = None
+    ) -> VoronoiDiagram:
+        """
+        Compute and return the Voronoi diagram for an (N, 2) coordinate array.
 
-        bounding_box = BoundingBox.from_points(points, margin=DEFAULT_BOUNDING_MARGIN)
+        Lets callers that already hold coordinates as an array (e.g.
+        PointFileReader.read_array) skip building Points just to have them
+        converted back.  *sites* may pass the matching Points; otherwise
+        they are created from *coords* once the input is known to be finite.
 
-        return VoronoiDiagram(
-            sites=list(points),
-            vertices=voronoi.vertices,
-            ridge_vertices=[list(rv) for rv in voronoi.ridge_vertices],
-            ridge_points=[list(rp) for rp in voronoi.ridge_points],
-            bounding_box=bounding_box,
-        )
+        Raises
+        ------
+        InsufficientPointsError : if fewer than 3 distinct points are supplied
+        ValueError              : if *coords* is not (N, 2) or any coordinate
+                                  is not a finite number
+        """
+        # Private copy: the diagram (and the cache) outlive the caller's
+        # buffer, which may be reused or modified afterwards
+        coords = np.array(coords, dtype=np.float64, order="C")
+        if coords.ndim != 2 or coords.shape[1] != 2:
+            raise ValueError(f"Expected an (N, 2) coordinate array, got shape {coords.shape}")
+        return self._compute(coords, sites)
 
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _validate(self, points: List[Point]) -> None:
-        """Raise InsufficientPointsError if *points* cannot form a diagram."""
-        distinct = self._distinct_points(points)
-        if len(distinct) < MIN_POINTS_REQUIRED:
+    def _compute(self, coords: np.ndarray, sites: Optional[List[Point]]) -> VoronoiDiagram:
+        """
+        Shared core of compute and compute_array.
+
+        *coords* must be a C-ordered (N, 2) float64 array the engine owns;
+        it is made read-only and kept as the diagram's sites_xy.
+        """
+        coords.setflags(write=False)
+        digest = hashlib.blake2b(repr(coords.shape).encode("ascii"), digest_size=16)
+        digest.update(coords.tobytes())
+        key = digest.digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        validate_points_array(coords)
+        keep = self._first_occurrences(coords)
+        self._validate(len(coords) if keep is None else len(keep), len(coords))
+        if sites is None:
+            sites = points_from_array(coords)
+        unique_xy = coords if keep is None else coords[keep]
+        voronoi = Voronoi(unique_xy)  # SciPy's 2-D default options: "Qbb Qc Qz"
+
+        ridge_points = voronoi.ridge_points  # already an (R, 2) int array; no copy
+        if keep is not None:
+            ridge_points = keep[ridge_points]  # back to indices into *sites*
+
+        bounding_box = BoundingBox.from_array(coords, margin=DEFAULT_BOUNDING_MARGIN)
+
+        diagram = VoronoiDiagram(
+            sites=list(sites),
+            vertices=voronoi.vertices,
+            ridge_vertices=self._ridge_vertices_array(voronoi.ridge_vertices),
+            ridge_points=ridge_points,
+            bounding_box=bounding_box,
+            sites_xy=coords,
+        )
+        self._cache[key] = diagram
+        if len(self._cache) > DIAGRAM_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return diagram
+
+    @staticmethod
+    def _validate(distinct: int, total: int) -> None:
+        """Raise InsufficientPointsError if *distinct* points cannot form a diagram."""
+        if distinct < MIN_POINTS_REQUIRED:
             raise InsufficientPointsError(
                 f"At least {MIN_POINTS_REQUIRED} distinct points are required, "
-                f"got {len(distinct)} distinct point(s) from {len(points)} input(s)."
+                f"got {distinct} distinct point(s) from {total} input(s)."
             )
 
     @staticmethod
-    def _distinct_points(points: List[Point]) -> List[Point]:
-        """Return deduplicated list of points."""
-        seen: set[tuple[float, float]] = set()
-        distinct: List[Point] = []
-        for p in points:
-            key = (p.x, p.y)
-            if key not in seen:
-                seen.add(key)
-                distinct.append(p)
-        return distinct
+    def _ridge_vertices_array(ridge_vertices: List[List[int]]) -> np.ndarray:
+        """Flatten SciPy's list of [i, j] pairs into an (R, 2) index array."""
+        return np.fromiter(
+            chain.from_iterable(ridge_vertices), dtype=np.intp, count=2 * len(ridge_vertices)
+        ).reshape(-1, 2)
+
+    @staticmethod
+    def _first_occurrences(coords: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Return the sorted row indices of the first copy of each distinct
+        point in *coords*, or None when every row is already distinct.
+
+        Duplicates are dropped before Qhull so it never sees coincident
+        sites; keeping first occurrences in input order lets ridge_points
+        be mapped back onto the caller's site list.
+        """
+        # A stable lexsort puts equal rows next to each other, lowest index
+        # first; it is about three times faster than np.unique(axis=0).
+        order = np.lexsort((coords[:, 1], coords[:, 0]))
+        ordered = coords[order]
+        is_first = np.ones(len(coords), dtype=bool)
+        np.any(ordered[1:] != ordered[:-1], axis=1, out=is_first[1:])
+        if is_first.all():
+            return None
+        return np.sort(order[is_first])
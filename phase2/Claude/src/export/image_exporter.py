@@ -1,7 +1,7 @@
 """
 image_exporter.py — Exports a VoronoiDiagram to a PNG image using Pillow.
 
-Concrete Strategy implementation.  Uses the same coordinate-mapping logic
+Concrete Strategy implementation.  Uses the same ridge-clipping logic
 as SVGExporter but draws via PIL's ImageDraw.
 """
 from __future__ import annotations
@@ -12,9 +12,9 @@ from typing import List, Optional, Tuple
 import numpy as np
 from PIL import Image, ImageDraw  # type: ignore
 
-from src.core.models import BoundingBox, VoronoiDiagram
+from src.core.models import BoundingBox, PixelCoords, VoronoiDiagram
+from src.core.ridges import compute_ridge_segments
 from src.export.exporter_base import DiagramExporter
-from src.export.svg_exporter import SVGExporter  # reuse ridge computation
 
 # Visual constants
 IMAGE_BACKGROUND_COLOR: Tuple[int, int, int] = (255, 255, 255)
@@ -29,10 +29,6 @@ VIEWPORT_PADDING_PX: int = 20
 class ImageExporter(DiagramExporter):
     """Concrete Strategy: writes Voronoi diagram as a PNG image."""
 
-    def __init__(self) -> None:
-        # Reuse SVGExporter's ridge-clipping logic via composition
-        self._ridge_helper = SVGExporter()
-
     @property
     def file_extension(self) -> str:
         return ".png"
@@ -45,20 +41,18 @@ class ImageExporter(DiagramExporter):
         image = Image.new("RGB", (img_width, img_height), IMAGE_BACKGROUND_COLOR)
         draw = ImageDraw.Draw(image)
 
+        ridge_px, sites_px = diagram.pixel_coords(
+            ("png", IMAGE_SCALE, VIEWPORT_PADDING_PX),
+            lambda: self._build_pixel_coords(diagram),
+        )
+
         # Draw ridges
-        for rv, rp in zip(diagram.ridge_vertices, diagram.ridge_points):
-            segment = self._ridge_helper._compute_ridge_segment(rv, rp, diagram)
-            if segment is None:
-                continue
-            p1, p2 = segment
-            x1, y1 = self._to_px(p1[0], p1[1], bb)
-            x2, y2 = self._to_px(p2[0], p2[1], bb)
+        for x1, y1, x2, y2 in ridge_px.reshape(-1, 4).tolist():
             draw.line([(x1, y1), (x2, y2)], fill=RIDGE_COLOR_RGB, width=RIDGE_WIDTH_PX)
 
         # Draw site markers
-        for site in diagram.sites:
-            cx, cy = self._to_px(site.x, site.y, bb)
-            r = SITE_RADIUS_PX
+        r = SITE_RADIUS_PX
+        for cx, cy in sites_px.tolist():
             draw.ellipse([(cx - r, cy - r), (cx + r, cy + r)], fill=SITE_COLOR_RGB)
 
         image.save(str(output_path), format="PNG")
@@ -67,8 +61,16 @@ class ImageExporter(DiagramExporter):
     # Coordinate helpers
     # ------------------------------------------------------------------
 
-    def _to_px(self, x: float, y: float, bb: BoundingBox) -> Tuple[int, int]:
-        """Map world coordinates to pixel coordinates."""
-        px = int((x - bb.x_min) * IMAGE_SCALE) + VIEWPORT_PADDING_PX
-        py = int((bb.y_max - y) * IMAGE_SCALE) + VIEWPORT_PADDING_PX
-        return px, py
+    def _build_pixel_coords(self, diagram: VoronoiDiagram) -> PixelCoords:
+        """Compute every ridge at once, then map ridges and sites to pixels."""
+        bb = diagram.bounding_box
+        segments = compute_ridge_segments(diagram)
+        return self._to_px(segments.reshape(-1, 2), bb), self._to_px(diagram.sites_xy, bb)
+
+    def _to_px(self, xy: np.ndarray, bb: BoundingBox) -> np.ndarray:
+        """Map an (N, 2) array of world coordinates to integer pixel coordinates."""
+        px = np.empty(xy.shape, dtype=np.int64)
+        px[:, 0] = ((xy[:, 0] - bb.x_min) * IMAGE_SCALE).astype(np.int64)
+        px[:, 1] = ((bb.y_max - xy[:, 1]) * IMAGE_SCALE).astype(np.int64)
+        px += VIEWPORT_PADDING_PX
+        return px
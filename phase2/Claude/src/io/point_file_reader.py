@@ -12,19 +12,44 @@ Example:
 """
 from __future__ import annotations
 
+import io
 import re
+import warnings
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List
 
-from src.core.models import Point
+import numpy as np
 
-# Regex: optional whitespace, a number, a comma, a number, optional whitespace
+from src.core.models import Point, points_to_array
+
+# Regex: optional whitespace, a number, a comma, a number, optional whitespace.
+# Only reached for lines the fast path below cannot take, so it mostly
+# serves to reject malformed input with a clear message.
 _COORDINATE_PATTERN = re.compile(
     r"^\s*(?P<x>[+-]?\d+(?:\.\d+)?)\s*,\s*(?P<y>[+-]?\d+(?:\.\d+)?)\s*$"
 )
 
+# Characters a plain "x,y" line is made of.  Lines using only these, whose
+# two numbers start (after a sign) and end with a digit, are parsed with
+# str.partition + float; anything else (exponents, "nan", ".5", "1."...)
+# goes through the strict regex above.
+_FAST_PATH_CHARS = frozenset("0123456789.,+- \t")
+
+# Finds any data line (not blank, not starting with '#') that holds a
+# character outside _FAST_PATH_CHARS (an exponent, "nan", an inline '#'...)
+# or a '.' not between two digits.  np.loadtxt would accept some of those,
+# so such files skip the bulk path.
+_NON_PLAIN_DATA_LINE = re.compile(
+    r"^(?![ \t]*#)[^\r\n]*?(?:[^0-9.,+\- \t\r\n]|(?<![0-9])\.|\.(?![0-9]))",
+    re.MULTILINE,
+)
+
 COMMENT_PREFIX: str = "#"
 
+# Files below this size are read in one go; larger ones are streamed line by
+# line so memory stays bounded.
+WHOLE_FILE_READ_LIMIT: int = 1 << 20  # 1 MiB
+
 
 class PointParseError(ValueError):
     """Raised when a line cannot be interpreted as a valid coordinate pair."""
@@ -39,6 +64,9 @@ class PointFileReader:
       - Skip blanks and comments
       - Delegate line parsing to _parse_line
       - Aggregate and return results
+
+    read_array() is the bulk variant: NumPy parses the whole file in C and
+    only falls back to the line-by-line parser to report errors.
     """
 
     def read(self, file_path: Path) -> List[Point]:
@@ -64,27 +92,96 @@ class PointFileReader:
 
         points: List[Point] = []
 
-        with file_path.open(encoding="utf-8") as fh:
-            for line_number, raw_line in enumerate(fh, start=1):
-                stripped = raw_line.strip()
-                if self._should_skip(stripped):
-                    continue
-                points.append(self._parse_line(stripped, line_number))
+        for line_number, raw_line in enumerate(self._lines(file_path), start=1):
+            stripped = raw_line.strip()
+            if self._should_skip(stripped):
+                continue
+            points.append(self._parse_line(stripped, line_number))
 
         if not points:
             raise ValueError(f"No valid points found in '{file_path}'.")
 
         return points
 
+    def read_array(self, file_path: Path) -> np.ndarray:
+        """
+        Parse *file_path* and return its coordinates as an (N, 2) float64 array.
+
+        Files whose data lines only use the plain 'x,y' characters are parsed
+        by np.loadtxt in one pass.  Anything else (exponents, 'nan', inline
+        comments...), or a loadtxt result that is not finite (x, y) rows, is
+        handed to read(), so both methods accept and reject the same files
+        and report the same errors, line numbers included.
+
+        Raises
+        ------
+        FileNotFoundError : if the file does not exist
+        PointParseError   : if any data line is malformed
+        ValueError        : if the file contains no valid points
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        text = file_path.read_text(encoding="utf-8")
+        coords = None
+        if not _NON_PLAIN_DATA_LINE.search(text):
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", UserWarning)  # "input contained no data"
+                    coords = np.loadtxt(
+                        io.StringIO(text),
+                        delimiter=",",
+                        comments=COMMENT_PREFIX,
+                        dtype=np.float64,
+                        ndmin=2,
+                    )
+            except ValueError:
+                pass
+
+        if coords is None or coords.shape[1:] != (2,) or not len(coords) or not np.isfinite(coords).all():
+            return points_to_array(self.read(file_path))
+        return coords
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _lines(file_path: Path) -> Iterable[str]:
+        """
+        Return the lines of *file_path*, read whole when it is small enough.
+
+        Text mode already folds \r\n and \r into \n, and split("\n") keeps
+        the same line numbering as iterating the file (splitlines would also
+        break on form feeds and other separators).
+        """
+        if file_path.stat().st_size < WHOLE_FILE_READ_LIMIT:
+            return file_path.read_text(encoding="utf-8").split("\n")
+        return PointFileReader._stream_lines(file_path)
+
+    @staticmethod
+    def _stream_lines(file_path: Path) -> Iterator[str]:
+        """Yield the lines of *file_path* through a buffered reader."""
+        with file_path.open(encoding="utf-8") as fh:
+            yield from fh
+
     @staticmethod
     def _should_skip(line: str) -> bool:
         """Return True for blank lines and comment lines."""
         return not line or line.startswith(COMMENT_PREFIX)
 
+    @staticmethod
+    def _is_plain_number(text: str) -> bool:
+        """
+        Return True if *text* starts (after an optional sign) and ends with a
+        digit, as _COORDINATE_PATTERN requires; float() alone would also
+        take '.5' or '1.'.
+        """
+        body = text.strip()
+        if body[:1] in ("+", "-"):
+            body = body[1:]
+        return body[:1].isdigit() and body[-1:].isdigit()
+
     @staticmethod
     def _parse_line(line: str, line_number: int) -> Point:
         """
@@ -92,10 +189,20 @@ class PointFileReader:
 
         Raises PointParseError on malformed input.
         """
+        if _FAST_PATH_CHARS.issuperset(line):
+            x_text, _, y_text = line.partition(",")
+            is_plain = PointFileReader._is_plain_number
+            if is_plain(x_text) and is_plain(y_text):
+                try:
+                    return Point(x=float(x_text), y=float(y_text))
+                except ValueError:
+                    pass  # e.g. "1,2,3" or "1 2,3": let the regex report it
+
         match = _COORDINATE_PATTERN.match(line)
         if not match:
             raise PointParseError(
                 f"Line {line_number}: cannot parse '{line}' as a coordinate pair. "
                 "Expected format: 'x,y' (e.g. '3.5,12')."
             )
-        return Point(x=float(match.group("x")), y=float(match.group("y")))
+        x_text, y_text = match.groups()
+        return Point(x=float(x_text), y=float(y_text))
@@ -14,7 +14,7 @@ from __future__ import annotations
 import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, messagebox
-from typing import Optional
+from typing import Optional, Tuple
 
 from src.core.models import VoronoiDiagram
 from src.core.voronoi_engine import InsufficientPointsError, VoronoiEngine
@@ -29,6 +29,7 @@ WINDOW_MIN_WIDTH: int = 800
 WINDOW_MIN_HEIGHT: int = 600
 CANVAS_DEFAULT_WIDTH: int = 780
 CANVAS_DEFAULT_HEIGHT: int = 540
+RESIZE_DEBOUNCE_MS: int = 50  # wait for <Configure> events to settle
 
 POINT_FILE_TYPES = [("Text / CSV files", "*.txt *.csv"), ("All files", "*.*")]
 SVG_FILE_TYPES = [("SVG files", "*.svg")]
@@ -50,6 +51,9 @@ class Application(tk.Tk):
         self._reader = PointFileReader()
         self._engine = VoronoiEngine()
         self._current_diagram: Optional[VoronoiDiagram] = None
+        # Pending debounced redraw, and what the canvas currently shows
+        self._resize_job: Optional[str] = None
+        self._rendered: Optional[Tuple[VoronoiDiagram, int, int]] = None
 
         self._setup_window()
         self._build_menu()
@@ -123,15 +127,15 @@ class Application(tk.Tk):
 
         file_path = Path(file_path_str)
         try:
-            points = self._reader.read(file_path)
-            diagram = self._engine.compute(points)
+            coords = self._reader.read_array(file_path)
+            diagram = self._engine.compute_array(coords)
         except (FileNotFoundError, PointParseError, InsufficientPointsError, ValueError) as exc:
             messagebox.showerror("Error loading file", str(exc))
             return
 
         self._current_diagram = diagram
-        self._renderer.render(diagram)
-        self._set_status(f"Loaded {len(points)} point(s) from '{file_path.name}'.")
+        self._render_current()
+        self._set_status(f"Loaded {len(coords)} point(s) from '{file_path.name}'.")
         self._enable_export_menus()
 
     def _on_export_svg(self) -> None:
@@ -160,8 +164,27 @@ class Application(tk.Tk):
     # ------------------------------------------------------------------
 
     def _on_canvas_resize(self, _event: tk.Event) -> None:
-        if self._current_diagram is not None:
-            self._renderer.render(self._current_diagram)
+        """Redraw once the burst of <Configure> events of a drag has settled."""
+        if self._current_diagram is None:
+            return
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(RESIZE_DEBOUNCE_MS, self._render_current)
+
+    def _render_current(self) -> None:
+        """Render the current diagram unless the canvas already shows it at this size."""
+        self._resize_job = None
+        width, height = self._canvas.winfo_width(), self._canvas.winfo_height()
+        if self._rendered is not None:
+            diagram, rendered_width, rendered_height = self._rendered
+            if (
+                diagram is self._current_diagram
+                and rendered_width == width
+                and rendered_height == height
+            ):
+                return
+        self._renderer.render(self._current_diagram)
+        self._rendered = (self._current_diagram, width, height)
 
     def _set_status(self, message: str) -> None:
         self._status_var.set(message)
@@ -2,18 +2,23 @@
 canvas_renderer.py — Draws a VoronoiDiagram onto a Tkinter Canvas.
 
 Responsible solely for rendering: coordinate transformation and drawing calls.
-The SVGExporter's ridge-clipping logic is reused via composition to avoid
-duplicating the infinite-ridge handling code (DRY).
+Ridge segments come from src.core.ridges, shared with the exporters, to
+avoid duplicating the infinite-ridge handling code (DRY).
+
+The diagram is rasterised off-screen with Pillow and shown as a single
+canvas image item, so a redraw costs one Tk call instead of one per ridge
+and per site.
 """
 from __future__ import annotations
 
 import tkinter as tk
-from typing import Optional
+from typing import Optional, Tuple
 
 import numpy as np
+from PIL import Image, ImageDraw, ImageTk  # type: ignore
 
-from src.core.models import BoundingBox, VoronoiDiagram
-from src.export.svg_exporter import SVGExporter  # reuse ridge helper
+from src.core.models import BoundingBox, PixelCoords, VoronoiDiagram
+from src.core.ridges import compute_ridge_segments
 
 # Visual constants
 RIDGE_COLOR: str = "#3a7bd5"
@@ -22,6 +27,7 @@ SITE_COLOR: str = "#e74c3c"
 SITE_RADIUS: int = 4
 BACKGROUND_COLOR: str = "#f9f9f9"
 CANVAS_PADDING: int = 20  # pixels of padding inside the canvas
+MIN_SEGMENT_SPAN: float = 1.0  # shorter ridges (in pixels) are not drawn
 
 
 class CanvasRenderer:
@@ -33,7 +39,8 @@ class CanvasRenderer:
 
     def __init__(self, canvas: tk.Canvas) -> None:
         self._canvas = canvas
-        self._ridge_helper = SVGExporter()
+        # Tk does not own the PhotoImage: keep a reference or it gets blanked
+        self._photo: Optional[ImageTk.PhotoImage] = None
 
     def render(self, diagram: VoronoiDiagram) -> None:
         """Clear the canvas and draw *diagram*."""
@@ -43,37 +50,53 @@ class CanvasRenderer:
         canvas_width = self._canvas.winfo_width() or int(self._canvas["width"])
         canvas_height = self._canvas.winfo_height() or int(self._canvas["height"])
 
-        bb = diagram.bounding_box
+        ridge_px, sites_px = diagram.pixel_coords(
+            ("canvas", canvas_width, canvas_height, CANVAS_PADDING),
+            lambda: self._build_pixel_coords(diagram, canvas_width, canvas_height),
+        )
+
+        image = Image.new("RGB", (canvas_width, canvas_height), BACKGROUND_COLOR)
+        draw = ImageDraw.Draw(image)
 
         # Draw ridges
-        for rv, rp in zip(diagram.ridge_vertices, diagram.ridge_points):
-            segment = self._ridge_helper._compute_ridge_segment(rv, rp, diagram)
-            if segment is None:
-                continue
-            p1, p2 = segment
-            x1, y1 = self._world_to_canvas(p1[0], p1[1], bb, canvas_width, canvas_height)
-            x2, y2 = self._world_to_canvas(p2[0], p2[1], bb, canvas_width, canvas_height)
-            self._canvas.create_line(x1, y1, x2, y2, fill=RIDGE_COLOR, width=RIDGE_WIDTH)
+        for x1, y1, x2, y2 in ridge_px.reshape(-1, 4).tolist():
+            draw.line([(x1, y1), (x2, y2)], fill=RIDGE_COLOR, width=RIDGE_WIDTH)
 
         # Draw site markers
-        for site in diagram.sites:
-            cx, cy = self._world_to_canvas(site.x, site.y, bb, canvas_width, canvas_height)
-            r = SITE_RADIUS
-            self._canvas.create_oval(cx - r, cy - r, cx + r, cy + r, fill=SITE_COLOR, outline="")
+        r = SITE_RADIUS
+        for cx, cy in sites_px.tolist():
+            draw.ellipse([(cx - r, cy - r), (cx + r, cy + r)], fill=SITE_COLOR)
+
+        self._photo = ImageTk.PhotoImage(image)
+        self._canvas.create_image(0, 0, anchor=tk.NW, image=self._photo)
 
     # ------------------------------------------------------------------
     # Coordinate helpers
     # ------------------------------------------------------------------
 
-    def _world_to_canvas(
-        self,
-        x: float,
-        y: float,
-        bb: BoundingBox,
-        canvas_width: int,
-        canvas_height: int,
-    ) -> tuple[float, float]:
-        """Map world coordinates to canvas pixel coordinates (y-axis flipped)."""
+    def _build_pixel_coords(
+        self, diagram: VoronoiDiagram, canvas_width: int, canvas_height: int
+    ) -> PixelCoords:
+        """
+        Compute every ridge in one pass, then map ridges and sites to canvas space.
+
+        Ridges spanning less than MIN_SEGMENT_SPAN pixels on both axes are
+        dropped: their pixels are already painted by the ridges they join.
+        """
+        bb = diagram.bounding_box
+        affine = self._affine(bb, canvas_width, canvas_height)
+        ridges = compute_ridge_segments(diagram).reshape(-1, 2)
+        ridge_px = self._world_to_canvas(ridges, bb, affine).reshape(-1, 2, 2)
+        span = np.abs(ridge_px[:, 0] - ridge_px[:, 1]).max(axis=1)
+        return (
+            ridge_px[span >= MIN_SEGMENT_SPAN].reshape(-1, 2),
+            self._world_to_canvas(diagram.sites_xy, bb, affine),
+        )
+
+    def _affine(
+        self, bb: BoundingBox, canvas_width: int, canvas_height: int
+    ) -> Tuple[float, float, float]:
+        """Return (scale, offset_x, offset_y) fitting *bb* centred in the canvas."""
         draw_width = canvas_width - 2 * CANVAS_PADDING
         draw_height = canvas_height - 2 * CANVAS_PADDING
 
@@ -84,7 +107,15 @@ class CanvasRenderer:
         # Center the diagram
         offset_x = CANVAS_PADDING + (draw_width - bb.width * scale) / 2
         offset_y = CANVAS_PADDING + (draw_height - bb.height * scale) / 2
+        return scale, offset_x, offset_y
 
-        px = offset_x + (x - bb.x_min) * scale
-        py = offset_y + (bb.y_max - y) * scale
-        return px, py
+    @staticmethod
+    def _world_to_canvas(
+        xy: np.ndarray, bb: BoundingBox, affine: Tuple[float, float, float]
+    ) -> np.ndarray:
+        """Map an (N, 2) array of world coordinates to canvas pixels (y-axis flipped)."""
+        scale, offset_x, offset_y = affine
+        px = np.empty_like(xy)
+        px[:, 0] = offset_x + (xy[:, 0] - bb.x_min) * scale
+        px[:, 1] = offset_y + (bb.y_max - xy[:, 1]) * scale
+        return px
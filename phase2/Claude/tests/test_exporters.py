@@ -8,8 +8,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 
+from src.core.models import BoundingBox, Point, VoronoiDiagram
+from src.export import svg_exporter
 from src.export.image_exporter import ImageExporter
 from src.export.svg_exporter import SVGExporter
 from tests.conftest import basic_diagram
@@ -47,6 +50,16 @@ class TestSVGExporter:
         # ElementTree préfixe le tag avec le namespace : {http://...}svg
         assert root.tag in ("svg", f"{{{SVG_NAMESPACE}}}svg")
 
+    def test_Should_define_viewBox_without_fixed_size_given_valid_diagram(
+        self, exporter, basic_diagram, tmp_path
+    ):
+        import xml.etree.ElementTree as ET
+        output_path = tmp_path / "diagram.svg"
+        exporter.export(basic_diagram, output_path)
+        root = ET.parse(str(output_path)).getroot()
+        assert all(v.isdigit() for v in root.get("viewBox").split())
+        assert root.get("width") is None and root.get("height") is None
+
     def test_Should_contain_site_markers_given_four_sites(
         self, exporter, basic_diagram, tmp_path
     ):
@@ -66,6 +79,55 @@ class TestSVGExporter:
         content = output_path.read_text()
         assert "<line" in content
 
+    def test_Should_group_shared_style_attributes_given_valid_diagram(
+        self, exporter, basic_diagram, tmp_path
+    ):
+        import xml.etree.ElementTree as ET
+        output_path = tmp_path / "diagram.svg"
+        exporter.export(basic_diagram, output_path)
+        ns = "{http://www.w3.org/2000/svg}"
+        root = ET.parse(str(output_path)).getroot()
+        ridge_group, site_group = root.findall(f"{ns}g")
+        assert ridge_group.get("stroke") and all(
+            line.get("stroke") is None for line in ridge_group.iter(f"{ns}line")
+        )
+        assert site_group.get("fill") and all(
+            circle.get("fill") is None for circle in site_group.iter(f"{ns}circle")
+        )
+
+    def test_Should_write_same_bytes_given_elements_streamed_one_per_chunk(
+        self, exporter, basic_diagram, tmp_path, monkeypatch
+    ):
+        whole_path = tmp_path / "whole.svg"
+        chunked_path = tmp_path / "chunked.svg"
+        exporter.export(basic_diagram, whole_path)
+        monkeypatch.setattr(svg_exporter, "ROWS_PER_WRITE", 1)
+        exporter.export(basic_diagram, chunked_path)
+        assert chunked_path.read_bytes() == whole_path.read_bytes()
+
+    def test_Should_round_half_way_coordinate_up_given_percent_2f_formatting(
+        self, exporter, tmp_path
+    ):
+        import xml.etree.ElementTree as ET
+        # Arrange — the site maps to viewport x = 28.765 + VIEWPORT_PADDING = 33.765,
+        # which '%.2f' writes as 33.77 (round(np.float64, 2) gave 33.76)
+        sites = [Point(28.765, 10.0), Point(4.0, 0.0), Point(2.0, 3.0)]
+        diagram = VoronoiDiagram(
+            sites=sites,
+            vertices=np.array([[2.0, 0.8]]),
+            ridge_vertices=np.array([[-1, 0]]),
+            ridge_points=np.array([[0, 1]]),
+            bounding_box=BoundingBox(0.0, 0.0, 40.0, 40.0),
+        )
+        output_path = tmp_path / "diagram.svg"
+
+        # Act
+        exporter.export(diagram, output_path)
+
+        # Assert
+        circles = ET.parse(str(output_path)).getroot().iter("{http://www.w3.org/2000/svg}circle")
+        assert [c.get("cx") for c in circles][0] == "33.77"
+
     def test_Should_produce_non_empty_file_given_valid_diagram(
         self, exporter, basic_diagram, tmp_path
     ):
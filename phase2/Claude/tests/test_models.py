@@ -7,9 +7,17 @@ Naming:  Should_<expected>_given_<context>
 from __future__ import annotations
 
 import math
+import numpy as np
 import pytest
 
-from src.core.models import BoundingBox, Point
+from src.core.models import (
+    PIXEL_CACHE_SIZE,
+    BoundingBox,
+    Point,
+    VoronoiDiagram,
+    points_to_array,
+    validate_points_array,
+)
 
 
 class TestPoint:
@@ -56,6 +64,15 @@ class TestPoint:
         assert len(points) == 2
 
 
+class TestValidatePointsArray:
+    def test_Should_accept_array_given_only_finite_coordinates(self):
+        validate_points_array(np.array([[0.0, 1.0], [2.5, -3.0]]))
+
+    def test_Should_raise_ValueError_given_nan_coordinate_in_array(self):
+        with pytest.raises(ValueError, match="finite"):
+            validate_points_array(np.array([[0.0, 1.0], [math.nan, 2.0]]))
+
+
 class TestBoundingBox:
     def test_Should_compute_correct_dimensions_given_simple_box(self):
         bb = BoundingBox(0, 0, 10, 5)
@@ -79,3 +96,52 @@ class TestBoundingBox:
         for p in points:
             assert bb.x_min <= p.x <= bb.x_max
             assert bb.y_min <= p.y <= bb.y_max
+
+    def test_Should_match_from_points_given_equivalent_coordinate_array(self):
+        points = [Point(1, 1), Point(4, 3), Point(2, 5)]
+        coords = points_to_array(points)
+        assert coords.shape == (3, 2)
+        assert BoundingBox.from_array(coords, margin=1.0) == BoundingBox.from_points(points, margin=1.0)
+
+
+class TestVoronoiDiagram:
+    @staticmethod
+    def _diagram() -> VoronoiDiagram:
+        sites = [Point(0, 0), Point(4, 0), Point(2, 3)]
+        return VoronoiDiagram(
+            sites=sites,
+            vertices=np.array([[2.0, 0.8]]),
+            ridge_vertices=np.array([[-1, 0]]),
+            ridge_points=np.array([[0, 1]]),
+            bounding_box=BoundingBox.from_points(sites),
+        )
+
+    def test_Should_build_once_given_same_viewport_key_twice(self):
+        diagram = self._diagram()
+        calls = []
+        build = lambda: calls.append(1) or (np.zeros((0, 2)), diagram.sites_xy)
+        first = diagram.pixel_coords(("canvas", 800, 600), build)
+        second = diagram.pixel_coords(("canvas", 800, 600), build)
+        assert len(calls) == 1
+        assert first is second
+
+    def test_Should_rebuild_given_different_viewport_key(self):
+        diagram = self._diagram()
+        calls = []
+        build = lambda: calls.append(1) or (np.zeros((0, 2)), diagram.sites_xy)
+        diagram.pixel_coords(("canvas", 800, 600), build)
+        diagram.pixel_coords(("canvas", 1024, 768), build)
+        assert len(calls) == 2
+
+    def test_Should_keep_cache_bounded_given_many_viewport_keys(self):
+        diagram = self._diagram()
+        build = lambda: (np.zeros((0, 2)), diagram.sites_xy)
+        for width in range(100):
+            diagram.pixel_coords(("canvas", width, 600, 10), build)
+        assert len(diagram._pixel_cache) == PIXEL_CACHE_SIZE
+        assert ("canvas", 99, 600, 10) in diagram._pixel_cache
+
+    def test_Should_return_mean_of_sites_given_sites_center(self):
+        diagram = self._diagram()
+        assert np.allclose(diagram.sites_center, [2.0, 1.0])
+        assert diagram.sites_center is diagram.sites_center
@@ -11,6 +11,7 @@ from pathlib import Path
 import pytest
 
 from src.core.models import Point
+from src.io import point_file_reader
 from src.io.point_file_reader import PointFileReader, PointParseError
 
 
@@ -96,3 +97,84 @@ class TestPointFileReader:
         f.write_text("abc,def\n")
         with pytest.raises(PointParseError):
             reader.read(f)
+
+    def test_Should_raise_PointParseError_given_exponent_or_nan_value(
+        self, reader, tmp_path
+    ):
+        f = tmp_path / "float_syntax.txt"
+        f.write_text("1e3,2\nnan,4\n")
+        with pytest.raises(PointParseError):
+            reader.read(f)
+
+    def test_Should_raise_PointParseError_given_bare_leading_or_trailing_dot(
+        self, reader, tmp_path
+    ):
+        for index, content in enumerate([".5,1\n", "1.,2\n"]):
+            f = tmp_path / f"dot_{index}.txt"
+            f.write_text(content)
+            with pytest.raises(PointParseError, match="Line 1"):
+                reader.read(f)
+            with pytest.raises(PointParseError, match="Line 1"):
+                reader.read_array(f)
+
+    def test_Should_report_line_number_given_file_streamed_above_read_limit(
+        self, reader, tmp_path, monkeypatch
+    ):
+        # Arrange — a limit of 0 forces the streaming path for every file
+        f = tmp_path / "streamed.txt"
+        f.write_text("# header\r\n1,2\r\n\r\n3,4\r\nbad\r\n")
+        monkeypatch.setattr(point_file_reader, "WHOLE_FILE_READ_LIMIT", 0)
+
+        # Act / Assert
+        with pytest.raises(PointParseError, match="Line 5"):
+            reader.read(f)
+
+    def test_Should_match_read_given_valid_file_read_as_array(
+        self, reader, valid_points_file
+    ):
+        coords = reader.read_array(valid_points_file)
+        assert coords.shape == (len(reader.read(valid_points_file)), 2)
+        assert [Point(x, y) for x, y in coords.tolist()] == reader.read(valid_points_file)
+
+    def test_Should_raise_PointParseError_given_malformed_line_read_as_array(
+        self, reader, tmp_path
+    ):
+        f = tmp_path / "bad.txt"
+        f.write_text("1,2\nabc,3\n")
+        with pytest.raises(PointParseError, match="Line 2"):
+            reader.read_array(f)
+
+    def test_Should_accept_and_reject_same_files_given_read_and_read_array(
+        self, reader, tmp_path
+    ):
+        # Arrange — files both readers must accept, and files both must reject
+        accepted = [
+            "1,2\n3,4\n",
+            "+1,-2\n",
+            "# e n\n1,2\n  # x\n3,4",
+        ]
+        rejected = [
+            "1e3,2\n",
+            "1,2 # note\n",
+            "nan,4\n",
+            ".5,1.\n",
+            "1,2,3\n",
+        ]
+
+        def outcome(parse, path):
+            try:
+                return [list(row) for row in parse(path)]
+            except PointParseError as error:
+                return str(error)
+
+        for index, content in enumerate(accepted + rejected):
+            f = tmp_path / f"case_{index}.txt"
+            f.write_text(content)
+
+            # Act
+            from_array = outcome(lambda path: reader.read_array(path).tolist(), f)
+            from_points = outcome(lambda path: [(p.x, p.y) for p in reader.read(path)], f)
+
+            # Assert
+            assert from_array == from_points, content
+            assert isinstance(from_points, str) == (content in rejected), content
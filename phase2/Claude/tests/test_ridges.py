@@ -0,0 +1,105 @@
+"""
+test_ridges.py — Unit tests for the ridge segment functions.
+
+Pattern: Arrange / Act / Assert (AAA).
+Naming:  Should_<expected>_given_<context>
+"""
+from __future__ import annotations
+
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.core.models import VoronoiDiagram
+from src.core.voronoi_engine import VoronoiEngine
+from src.core.ridges import compute_ridge_segments
+
+# ((x1, y1), (x2, y2)) world-space endpoints of one ridge
+Segment = Tuple[Tuple[float, float], Tuple[float, float]]
+
+
+def reference_ridge_segment(
+    ridge_vertex_indices: List[int],
+    ridge_point_indices: List[int],
+    diagram: VoronoiDiagram,
+) -> Optional[Segment]:
+    """
+    Straightforward one-ridge-at-a-time oracle for compute_ridge_segments.
+
+    Returns (p1, p2) world coordinates for the ridge, or None when it is
+    not drawable (both endpoints at infinity, or coincident sites).
+    """
+    bb = diagram.bounding_box
+    i, j = ridge_vertex_indices
+
+    if i >= 0 and j >= 0:
+        # Finite ridge
+        return tuple(diagram.vertices[i].tolist()), tuple(diagram.vertices[j].tolist())
+
+    # Infinite ridge — find the finite vertex
+    finite_idx = i if i >= 0 else j
+    if finite_idx < 0:
+        return None  # both endpoints at infinity — skip
+
+    vx, vy = diagram.vertices[finite_idx].tolist()
+
+    # Direction = perpendicular to the segment joining the two sites
+    p_idx, q_idx = ridge_point_indices
+    px, py = diagram.sites_xy[p_idx].tolist()
+    qx, qy = diagram.sites_xy[q_idx].tolist()
+    nx, ny = -(qy - py), qx - px
+
+    # Ensure the direction points away from the interior of the diagram
+    cx, cy = diagram.sites_center.tolist()
+    if ((px + qx) / 2.0 - cx) * nx + ((py + qy) / 2.0 - cy) * ny < 0:
+        nx, ny = -nx, -ny
+
+    # Normalise and scale to a length guaranteed to exit the bounding box
+    norm = math.hypot(nx, ny)
+    if norm == 0:
+        return None
+    scale = max(bb.width, bb.height) * 2 / norm
+
+    return (vx, vy), (vx + nx * scale, vy + ny * scale)
+
+
+class TestComputeRidgeSegments:
+
+    def test_Should_return_both_vertices_given_finite_ridge(self, five_random_points):
+        # Arrange
+        diagram = VoronoiEngine().compute(five_random_points)
+        finite = [rv for rv in diagram.ridge_vertices.tolist() if min(rv) >= 0][0]
+        # Act
+        segments = compute_ridge_segments(diagram)
+        # Assert
+        expected = diagram.vertices[finite]
+        assert any(np.array_equal(segment, expected) for segment in segments)
+
+    def test_Should_end_outside_bounding_box_given_infinite_ridges(self, basic_diagram):
+        # Arrange
+        bb = basic_diagram.bounding_box
+        infinite = (basic_diagram.ridge_vertices < 0).any(axis=1)
+        # Act
+        segments = compute_ridge_segments(basic_diagram)
+        # Assert — every ridge of the square is drawable, in ridge order
+        assert len(segments) == len(basic_diagram.ridge_vertices)
+        for x, y in segments[infinite, 1].tolist():
+            assert not (bb.x_min <= x <= bb.x_max and bb.y_min <= y <= bb.y_max)
+
+    def test_Should_match_reference_segments_given_same_diagram(self, five_random_points):
+        # Arrange
+        diagram = VoronoiEngine().compute(five_random_points)
+        expected = [
+            s
+            for s in (
+                reference_ridge_segment(rv, rp, diagram)
+                for rv, rp in zip(diagram.ridge_vertices.tolist(), diagram.ridge_points.tolist())
+            )
+            if s is not None
+        ]
+        # Act
+        segments = compute_ridge_segments(diagram)
+        # Assert
+        assert segments.shape == (len(expected), 2, 2)
+        assert np.allclose(segments, np.asarray(expected))
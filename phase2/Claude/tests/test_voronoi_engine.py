@@ -6,10 +6,15 @@ Naming:  Should_<expected>_given_<context>
 """
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from src.core.models import Point, VoronoiDiagram
-from src.core.voronoi_engine import InsufficientPointsError, VoronoiEngine
+from src.core.voronoi_engine import (
+    DIAGRAM_CACHE_SIZE,
+    InsufficientPointsError,
+    VoronoiEngine,
+)
 
 
 @pytest.fixture
@@ -90,8 +95,106 @@ class TestVoronoiEngine:
         diagram = engine.compute(points)
         assert len(diagram.sites) == 100
 
+    def test_Should_reuse_cached_diagram_given_same_points_twice(
+        self, engine, four_cardinal_points
+    ):
+        first = engine.compute(four_cardinal_points)
+        second = engine.compute(list(four_cardinal_points))
+        assert second is first
+
+    def test_Should_recompute_diagram_given_different_points(
+        self, engine, four_cardinal_points, five_random_points
+    ):
+        first = engine.compute(four_cardinal_points)
+        second = engine.compute(five_random_points)
+        assert second is not first
+        assert second.sites == five_random_points
+
+    def test_Should_reuse_cached_diagram_given_point_set_seen_before_another(
+        self, engine, four_cardinal_points, five_random_points
+    ):
+        # Arrange
+        first = engine.compute(four_cardinal_points)
+        engine.compute(five_random_points)
+
+        # Act
+        again = engine.compute(four_cardinal_points)
+
+        # Assert
+        assert again is first
+
+    def test_Should_recompute_diagram_given_point_set_evicted_from_cache(
+        self, engine, four_cardinal_points
+    ):
+        # Arrange
+        first = engine.compute(four_cardinal_points)
+        for i in range(DIAGRAM_CACHE_SIZE):
+            engine.compute([Point(0, 0), Point(1, 0), Point(0, 1), Point(i + 2, i + 2)])
+
+        # Act
+        again = engine.compute(four_cardinal_points)
+
+        # Assert
+        assert again is not first
+
     def test_Should_handle_collinear_points_given_three_collinear_points(self, engine):
         """SciPy can handle collinear points without crashing."""
         points = [Point(0, 0), Point(1, 0), Point(2, 0), Point(0, 1)]
         diagram = engine.compute(points)
         assert isinstance(diagram, VoronoiDiagram)
+
+    def test_Should_match_point_input_given_same_coordinates_as_array(
+        self, engine, five_random_points
+    ):
+        # Arrange
+        coords = np.array([[p.x, p.y] for p in five_random_points])
+        expected = VoronoiEngine().compute(five_random_points)
+
+        # Act
+        diagram = engine.compute_array(coords)
+
+        # Assert
+        assert diagram.sites == five_random_points
+        np.testing.assert_array_equal(diagram.ridge_points, expected.ridge_points)
+
+    def test_Should_raise_value_error_given_array_with_non_finite_coordinate(self, engine):
+        # Arrange
+        coords = np.array([[0.0, 0.0], [1.0, np.nan], [2.0, 1.0], [0.0, 3.0]])
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            engine.compute_array(coords)
+
+    def test_Should_index_original_sites_given_duplicate_points(self, engine):
+        # Arrange — the duplicate sits before the last distinct point
+        points = [Point(0, 0), Point(4, 0), Point(0, 0), Point(0, 4), Point(4, 4)]
+
+        # Act
+        diagram = engine.compute(points)
+
+        # Assert — the copy at index 2 is dropped, index 4 still maps to (4, 4)
+        used = set(diagram.ridge_points.ravel().tolist())
+        assert used == {0, 1, 3, 4}
+
+    def test_Should_keep_diagram_unchanged_given_caller_modifies_array_afterwards(
+        self, engine, five_random_points
+    ):
+        # Arrange
+        coords = np.array([[p.x, p.y] for p in five_random_points])
+        diagram = engine.compute_array(coords)
+
+        # Act
+        coords[1] = [40.0, 0.0]
+
+        # Assert
+        assert diagram.sites_xy.tolist() == [[p.x, p.y] for p in diagram.sites]
+        assert not diagram.sites_xy.flags.writeable
+
+    def test_Should_raise_value_error_given_array_not_of_shape_n_by_2(self, engine):
+        # Arrange — same bytes as an already cached (6, 2) array, viewed as (4, 3)
+        coords = np.array([[0, 0], [4, 0], [0, 4], [4, 4], [2, 1], [1, 3]], dtype=np.float64)
+        engine.compute_array(coords)
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="shape"):
+            engine.compute_array(coords.reshape(4, 3))